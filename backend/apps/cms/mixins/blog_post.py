@@ -40,7 +40,7 @@ class BlogPostMixin:
 
     @classmethod
     def get_one(cls, db: Session, user, item_id: int, *args, **kwargs):
-        res = db.query(cls).get(item_id)
+        res = db.get(cls, item_id)
         if user is None or not user.signed_up:
             if not res.published:
                 raise HTTPException(
@@ -12,7 +12,7 @@ class MenuMixin:
 
     @classmethod
     def get_one(cls, db: Session, user, item_id: int, *args, **kwargs):
-        res = db.query(cls).get(item_id)
+        res = db.get(cls, item_id)
         return res
 
     @classmethod
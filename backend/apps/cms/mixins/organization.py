@@ -1,4 +1,7 @@
 import logging
+import threading
+import time
+from collections import OrderedDict
 
 from sqlalchemy import Column, String
 from sqlalchemy.orm import Session
@@ -8,6 +11,20 @@ from deepsel.utils.crypto import encrypt as _encrypt, decrypt as _decrypt
 
 logger = logging.getLogger(__name__)
 
+# In-process cache of domain -> organization id, so public requests resolving
+# their site do not load and scan every organization. Cleared on organization
+# writes in this process; other workers pick changes up within the TTL.
+DOMAIN_CACHE_TTL = 60  # seconds
+DOMAIN_CACHE_MAX_SIZE = 1024
+
+_domain_cache: OrderedDict = OrderedDict()
+_domain_cache_lock = threading.Lock()
+
+
+def clear_domain_cache():
+    with _domain_cache_lock:
+        _domain_cache.clear()
+
 
 class _CMSSettingsEncryptedData:
     _openrouter_api_key = Column("openrouter_api_key", String(255))
@@ -40,6 +57,25 @@ class CMSSettingsMixin(_CMSSettingsEncryptedData):
     @classmethod
     def find_organization_by_domain(cls, domain: str, db: Session):
         """Find organization by domain, fallback to wildcard (*) if not found"""
+        now = time.monotonic()
+        with _domain_cache_lock:
+            entry = _domain_cache.get(domain)
+        if entry is not None and entry[0] > now:
+            org = db.get(cls, entry[1])
+            if org is not None:
+                return org
+
+        org = cls._match_organization_by_domain(domain, db)
+        if org is not None:
+            with _domain_cache_lock:
+                _domain_cache[domain] = (now + DOMAIN_CACHE_TTL, org.id)
+                _domain_cache.move_to_end(domain)
+                while len(_domain_cache) > DOMAIN_CACHE_MAX_SIZE:
+                    _domain_cache.popitem(last=False)
+        return org
+
+    @classmethod
+    def _match_organization_by_domain(cls, domain: str, db: Session):
         # First try exact domain match
         organizations = db.query(cls).all()
         for org in organizations:
@@ -73,7 +109,7 @@ class CMSSettingsMixin(_CMSSettingsEncryptedData):
         public_settings = super().get_public_settings(organization_id, db)
 
         # Get the organization to access our extended fields
-        organization = db.query(cls).get(organization_id)
+        organization = db.get(cls, organization_id)
         if not organization:
             return public_settings
 
@@ -14,7 +14,7 @@ class PageMixin:
 
     @classmethod
     def get_one(cls, db: Session, user, item_id: int, *args, **kwargs):
-        res = db.query(cls).get(item_id)
+        res = db.get(cls, item_id)
         if user is None or not user.signed_up:
             if not res.published:
                 raise HTTPException(
@@ -1,8 +1,8 @@
 from apps.core.models.organization import OrganizationModel
-from sqlalchemy import Column, Integer, ForeignKey, JSON, Boolean, String, Text
+from sqlalchemy import Column, Integer, ForeignKey, JSON, Boolean, String, Text, event
 from sqlalchemy.orm import relationship
 
-from apps.cms.mixins.organization import CMSSettingsMixin
+from apps.cms.mixins.organization import CMSSettingsMixin, clear_domain_cache
 
 
 class CMSSettingsModel(CMSSettingsMixin, OrganizationModel):
@@ -54,3 +54,10 @@ class CMSSettingsModel(CMSSettingsMixin, OrganizationModel):
 
     # theme settings
     selected_theme = Column(String(255), nullable=True)
+
+
+@event.listens_for(OrganizationModel, "after_insert", propagate=True)
+@event.listens_for(OrganizationModel, "after_update", propagate=True)
+@event.listens_for(OrganizationModel, "after_delete", propagate=True)
+def _clear_domain_cache(mapper, connection, target):
+    clear_domain_cache()
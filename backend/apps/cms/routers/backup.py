@@ -2,15 +2,24 @@ import logging
 import csv
 import json
 import io
+import itertools
+from collections import deque
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 import zipfile
 import tempfile
-import shutil
 import os
+import orjson
 from fastapi import Depends, HTTPException, status, UploadFile, Form
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from db import get_db
-from apps.core.utils.get_current_user import get_current_user
+from sqlalchemy.orm import Session, contains_eager, selectinload
+from sqlalchemy.orm.attributes import flag_modified
+from db import get_db, get_db_context
+from apps.core.utils.get_current_user import (
+    ADMIN_ROLE_IDS,
+    get_current_user,
+    get_current_user_role_ids,
+)
 from apps.core.utils.models_pool import models_pool
 from deepsel.utils.install_apps import import_csv_data
 from deepsel.utils.api_router import create_api_router
@@ -20,43 +29,122 @@ logger = logging.getLogger(__name__)
 router = create_api_router("backup", tags=["Backup"])
 UserModel = models_pool["user"]
 
-
-@router.get("/export")
-def export_backup(
-    organization_id: int,
-    db: Session = Depends(get_db),
-    user: UserModel = Depends(get_current_user),
-):
+# Rows fetched per round trip when streaming records into the export
+EXPORT_BATCH_SIZE = 500
+# Deflate level for the export; CSV text compresses nearly as well at 3 as at
+# the default 6 for about half the CPU
+EXPORT_COMPRESS_LEVEL = 3
+# Attachments whose storage reads run ahead of the ZIP writer; each holds at
+# most its first chunk in memory until it is written
+EXPORT_ATTACHMENT_WORKERS = 8
+# Attachment types that are already compressed. They are deflated at the
+# fastest level rather than stored: the export cannot seek, so every entry has
+# a data descriptor, and some unzip tools reject stored entries that do
+COMPRESSED_CONTENT_TYPES = {
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+    "image/gif",
+    "image/avif",
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "font/woff2",
+}
+COMPRESSED_CONTENT_TYPE_PREFIXES = ("video/", "audio/")
+COMPRESSED_MEDIA_COMPRESS_LEVEL = 1
+
+
+class _ZipStreamSink(io.RawIOBase):
+    """Unseekable write target that buffers ZIP bytes until they are drained.
+
+    zipfile writes data descriptors when it cannot seek, so entries can be
+    sent to the client as soon as they are compressed.
     """
-    Export backup for the specified organization.
-    Returns a ZIP file containing CSVs for Pages, Blog Posts, Menus, Attachments and the attachment files.
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _open_attachment_entry(zip_file: zipfile.ZipFile, path: str, content_type):
+    """Open a ZIP entry for an attachment, deflating compressed media at level 1.
+
+    ZipFile.open() takes no per-entry level; an entry opened by name is
+    deflated at the archive's compresslevel (the constructor argument of the
+    same name), so that is set for each attachment before it is opened. This
+    relies on CPython's zipfile reading compresslevel at open() time, which
+    test_backup_zip covers.
     """
-    # Check permission (admin only)
-    if not any(
-        role.string_id in ["admin_role", "super_admin_role"] for role in user.roles
+    content_type = content_type or ""
+    if content_type in COMPRESSED_CONTENT_TYPES or content_type.startswith(
+        COMPRESSED_CONTENT_TYPE_PREFIXES
     ):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have permission to export backup",
-        )
+        zip_file.compresslevel = COMPRESSED_MEDIA_COMPRESS_LEVEL
+    else:
+        zip_file.compresslevel = EXPORT_COMPRESS_LEVEL
+    return zip_file.open(path, "w", force_zip64=True)
 
-    # Validate organization access
-    allowed_org_ids = user.get_org_ids()
-    if organization_id not in allowed_org_ids:
-        # Check if super admin, they might access any org?
-        # The user request said "also have to check permission for user to this org".
-        # Usually super_admin has access to everything.
-        # Let's check if user has super_admin_role.
-        is_super_admin = any(
-            role.string_id == "super_admin_role" for role in user.roles
-        )
-        if not is_super_admin:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have permission to access this organization",
-            )
 
-    org_id = organization_id
+def _open_attachment(AttachmentModel, storage_type, name: str):
+    """Start reading a stored file; returns its chunk iterator and first chunk.
+
+    Runs in a worker thread, so it takes plain column values rather than an
+    ORM instance of the export's session. Reading the first chunk before the
+    ZIP entry is added means a missing file is skipped rather than exported
+    empty.
+    """
+    file_data = AttachmentModel.iter_stored_data(storage_type, name)
+    return file_data, next(file_data, b"")
+
+
+def _close_opened(future):
+    """Close the chunk iterator returned by a submitted _open_attachment."""
+    try:
+        file_data, _ = future.result()
+    except Exception:
+        return
+    file_data.close()
+
+
+def _prefetch(pool: ThreadPoolExecutor, items, fn, depth: int):
+    """Yield (item, future of fn(item)) in order, keeping `depth` calls ahead.
+
+    If the consumer stops early, calls that have not started are cancelled
+    and the results of those already running are closed.
+    """
+    pending = deque()
+    try:
+        for item in items:
+            pending.append((item, pool.submit(fn, item)))
+            if len(pending) >= depth:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+    finally:
+        for _, future in pending:
+            if not future.cancel():
+                _close_opened(future)
+
+
+def _iter_backup_zip(org_id: int):
+    """Yield the backup ZIP for the organization while it is being built.
+
+    Uses its own session, as the body is produced after the request's
+    dependencies have been cleaned up.
+    """
+    sink = _ZipStreamSink()
 
     # Helper to generate string_id if missing
     def ensure_string_id(record, model_name):
@@ -64,39 +152,68 @@ def export_backup(
             return f"{model_name}_{record.id}"
         return record.string_id
 
-    # Helper to write model data to CSV in ZIP
+    # Helper to build the per-column value getter once per CSV. Whether the
+    # field exists is checked on the model class, not probed on each row.
+    def build_getter(field, model_name, model_cls, extra_fields):
+        if field == "string_id":
+            return lambda record: ensure_string_id(record, model_name)
+        if extra_fields and field in extra_fields:
+            return extra_fields[field]
+        if not hasattr(model_cls, field):
+            return lambda record: ""
+
+        def getter(record):
+            val = getattr(record, field)
+            # Handle boolean values
+            if isinstance(val, bool):
+                return str(val).lower()
+            return val
+
+        return getter
+
+    # Helper to write model data to CSV in ZIP, yielding the compressed bytes
     def write_model_csv(zip_file, model_name, records, fieldnames, extra_fields=None):
-        if not records:
+        # records may be a streamed query, so peek instead of testing truthiness
+        records = iter(records)
+        first_record = next(records, None)
+        if first_record is None:
             return
 
-        csv_buffer = io.StringIO()
-        writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for record in records:
-            row = {}
-            for field in fieldnames:
-                if field == "string_id":
-                    row[field] = ensure_string_id(record, model_name)
-                elif extra_fields and field in extra_fields:
-                    row[field] = extra_fields[field](record)
-                elif hasattr(record, field):
-                    val = getattr(record, field)
-                    # Handle boolean values
-                    if isinstance(val, bool):
-                        row[field] = str(val).lower()
-                    else:
-                        row[field] = val
-            writer.writerow(row)
-
-        zip_file.writestr(f"{model_name}.csv", csv_buffer.getvalue())
-
-    # Create ZIP in memory
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        getters = [
+            build_getter(field, model_name, type(first_record), extra_fields)
+            for field in fieldnames
+        ]
+        # The size is unknown up front and the output cannot seek back to fix
+        # the header, so the entry is written as ZIP64 in case it exceeds 2 GiB
+        with (
+            zip_file.open(f"{model_name}.csv", "w", force_zip64=True) as entry,
+            io.TextIOWrapper(entry, encoding="utf-8", newline="") as csv_file,
+        ):
+            writer = csv.writer(csv_file)
+            writer.writerow(fieldnames)
+
+            for record in itertools.chain([first_record], records):
+                writer.writerow([getter(record) for getter in getters])
+                if chunk := sink.drain():
+                    yield chunk
+
+    # Rows are fetched from server-side cursors in batches rather than loaded
+    # with .all(); the session's weak identity map drops written records
+    def stream(query):
+        return query.yield_per(EXPORT_BATCH_SIZE)
+
+    with (
+        get_db_context() as db,
+        zipfile.ZipFile(
+            sink, "w", zipfile.ZIP_DEFLATED, compresslevel=EXPORT_COMPRESS_LEVEL
+        ) as zip_file,
+    ):
+        # One snapshot for all the streamed queries of the export
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
         # 1. Export Pages
         PageModel = models_pool["page"]
-        pages = db.query(PageModel).filter_by(organization_id=org_id).all()
+        pages = stream(db.query(PageModel).filter_by(organization_id=org_id))
 
         page_fields = [
             "string_id",
@@ -105,16 +222,20 @@ def export_backup(
             "page_custom_code",
             "published",
         ]
-        write_model_csv(zip_file, "page", pages, page_fields)
+        yield from write_model_csv(zip_file, "page", pages, page_fields)
 
         # Export PageContent
         PageContentModel = models_pool["page_content"]
         # Filter page contents where page belongs to org
-        page_contents = (
+        page_contents = stream(
             db.query(PageContentModel)
             .join(PageModel)
             .filter(PageModel.organization_id == org_id)
-            .all()
+            .options(
+                contains_eager(PageContentModel.page),
+                selectinload(PageContentModel.locale),
+                selectinload(PageContentModel.seo_metadata_featured_image),
+            )
         )
 
         # Need to link back to page using string_id
@@ -145,7 +266,7 @@ def export_backup(
                 else ""
             )
 
-        write_model_csv(
+        yield from write_model_csv(
             zip_file,
             "page_content",
             page_contents,
@@ -153,14 +274,16 @@ def export_backup(
             extra_fields={
                 "page/page_id": get_page_string_id,
                 "locale/locale_id": get_locale_string_id,
-                "json:content": lambda r: json.dumps(r.content) if r.content else "[]",
+                "json:content": lambda r: (
+                    orjson.dumps(r.content).decode("utf-8") if r.content else "[]"
+                ),
                 "attachment/seo_metadata_featured_image_id": get_seo_featured_image_string_id,
             },
         )
 
         # 2. Export Blog Posts
         BlogPostModel = models_pool["blog_post"]
-        blog_posts = db.query(BlogPostModel).filter_by(organization_id=org_id).all()
+        blog_posts = stream(db.query(BlogPostModel).filter_by(organization_id=org_id))
         blog_post_fields = [
             "string_id",
             "slug",
@@ -170,15 +293,20 @@ def export_backup(
             "blog_post_custom_code",
             # "author_id", # Skip author to avoid user dependency issues
         ]
-        write_model_csv(zip_file, "blog_post", blog_posts, blog_post_fields)
+        yield from write_model_csv(zip_file, "blog_post", blog_posts, blog_post_fields)
 
         # Export BlogPostContent
         BlogPostContentModel = models_pool["blog_post_content"]
-        blog_post_contents = (
+        blog_post_contents = stream(
             db.query(BlogPostContentModel)
             .join(BlogPostModel)
             .filter(BlogPostModel.organization_id == org_id)
-            .all()
+            .options(
+                contains_eager(BlogPostContentModel.post),
+                selectinload(BlogPostContentModel.locale),
+                selectinload(BlogPostContentModel.featured_image),
+                selectinload(BlogPostContentModel.seo_metadata_featured_image),
+            )
         )
 
         def get_post_string_id(record):
@@ -213,7 +341,7 @@ def export_backup(
                 else ""
             )
 
-        write_model_csv(
+        yield from write_model_csv(
             zip_file,
             "blog_post_content",
             blog_post_contents,
@@ -228,7 +356,11 @@ def export_backup(
 
         # 3. Export Menus
         MenuModel = models_pool["menu"]
-        menus = db.query(MenuModel).filter_by(organization_id=org_id).all()
+        menus = stream(
+            db.query(MenuModel)
+            .filter_by(organization_id=org_id)
+            .options(selectinload(MenuModel.parent))
+        )
 
         # Handle parent/child relationship
         def get_parent_string_id(record):
@@ -242,6 +374,24 @@ def export_backup(
             "json:translations",  # Menu uses JSON for translations
         ]
 
+        # page_content id -> string_id for menu translations, loaded in one query
+        # for the organization; ids outside it are looked up once on demand
+        page_content_string_ids = dict(
+            db.query(PageContentModel.id, PageContentModel.string_id)
+            .join(PageModel)
+            .filter(PageModel.organization_id == org_id)
+        )
+
+        def get_page_content_string_id(page_content_id):
+            if page_content_id not in page_content_string_ids:
+                page_content = (
+                    db.query(PageContentModel).filter_by(id=page_content_id).first()
+                )
+                page_content_string_ids[page_content_id] = (
+                    page_content.string_id if page_content else None
+                )
+            return page_content_string_ids[page_content_id]
+
         # Need to serialize translations dict to JSON string
         # Also add page_content_string_id alongside page_content_id for portability
         def get_translations_json(record):
@@ -266,7 +416,6 @@ def export_backup(
                 )
                 return "{}"
 
-            PageContentModel = models_pool.get("page_content")
             translations_copy = {}
 
             for locale, data in translations_data.items():
@@ -280,18 +429,18 @@ def export_backup(
                     and translations_copy[locale]["page_content_id"]
                 ):
                     page_content_id = translations_copy[locale]["page_content_id"]
-                    page_content = (
-                        db.query(PageContentModel).filter_by(id=page_content_id).first()
-                    )
-                    if page_content and page_content.string_id:
+                    page_content_string_id = get_page_content_string_id(page_content_id)
+                    if page_content_string_id:
                         # Add string_id alongside the integer ID
                         translations_copy[locale][
                             "page_content_string_id"
-                        ] = page_content.string_id
+                        ] = page_content_string_id
 
-            return json.dumps(translations_copy)
+            return orjson.dumps(
+                translations_copy, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
 
-        write_model_csv(
+        yield from write_model_csv(
             zip_file,
             "menu",
             menus,
@@ -304,7 +453,7 @@ def export_backup(
 
         # 4. Export Attachments
         AttachmentModel = models_pool["attachment"]
-        attachments = db.query(AttachmentModel).filter_by(organization_id=org_id).all()
+        attachments = db.query(AttachmentModel).filter_by(organization_id=org_id)
 
         attachment_fields = [
             "string_id",
@@ -320,27 +469,107 @@ def export_backup(
             filename = os.path.basename(record.name)
             return f"attachments/{filename}"
 
-        write_model_csv(
+        yield from write_model_csv(
             zip_file,
             "attachment",
-            attachments,
+            stream(attachments),
             attachment_fields,
             extra_fields={"file:file_path": get_zip_file_path},
         )
 
-        # Add attachment files to ZIP
-        for attachment in attachments:
-            try:
-                file_data = attachment.get_data()
-                filename = os.path.basename(attachment.name)
-                zip_file.writestr(f"attachments/{filename}", file_data)
-            except Exception as e:
-                logger.error(f"Failed to export attachment {attachment.id}: {e}")
-                # Continue even if one file fails? Yes.
+        # Add attachment files to ZIP, chunk by chunk. Storage reads (disk,
+        # S3, Azure) are opened in a thread pool while earlier entries are
+        # being written; ZipFile itself is only written from this thread, in
+        # order. Workers get plain column values, never the session's
+        # instances, and each prefetched file holds only its first chunk.
+        rows = stream(
+            attachments.with_entities(
+                AttachmentModel.name,
+                AttachmentModel.type,
+                AttachmentModel.content_type,
+            )
+        )
+        with (
+            ThreadPoolExecutor(max_workers=EXPORT_ATTACHMENT_WORKERS) as pool,
+            closing(
+                _prefetch(
+                    pool,
+                    rows,
+                    lambda row: _open_attachment(AttachmentModel, row.type, row.name),
+                    EXPORT_ATTACHMENT_WORKERS,
+                )
+            ) as opened_files,
+        ):
+            for row, opened in opened_files:
+                try:
+                    file_data, first_chunk = opened.result()
+                except Exception as e:
+                    # Nothing has been written for this file yet, so skip it
+                    logger.error("Failed to export attachment %s: %s", row.name, e)
+                    continue
+
+                filename = os.path.basename(row.name)
+                # A failure once the entry is open would leave a truncated
+                # member behind, so it aborts the export instead of being
+                # skipped; the client gets an archive with no central directory
+                try:
+                    with (
+                        closing(file_data),
+                        _open_attachment_entry(
+                            zip_file, f"attachments/{filename}", row.content_type
+                        ) as entry,
+                    ):
+                        entry.write(first_chunk)
+                        for data in file_data:
+                            entry.write(data)
+                            if chunk := sink.drain():
+                                yield chunk
+                except Exception:
+                    logger.exception(
+                        "Aborting backup export: failed reading attachment %s",
+                        row.name,
+                    )
+                    raise
+
+    # Remaining entry data and the central directory
+    if chunk := sink.drain():
+        yield chunk
+
+
+@router.get("/export")
+def export_backup(
+    organization_id: int,
+    db: Session = Depends(get_db),
+    user: UserModel = Depends(get_current_user),
+    role_ids: frozenset[str] = Depends(get_current_user_role_ids),
+):
+    """
+    Export backup for the specified organization.
+    Returns a ZIP file containing CSVs for Pages, Blog Posts, Menus, Attachments and the attachment files.
+    """
+    # Check permission (admin only)
+    if not ADMIN_ROLE_IDS & role_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to export backup",
+        )
+
+    # Validate organization access
+    allowed_org_ids = user.get_org_ids()
+    if organization_id not in allowed_org_ids:
+        # Check if super admin, they might access any org?
+        # The user request said "also have to check permission for user to this org".
+        # Usually super_admin has access to everything.
+        # Let's check if user has super_admin_role.
+        is_super_admin = "super_admin_role" in role_ids
+        if not is_super_admin:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You do not have permission to access this organization",
+            )
 
-    zip_buffer.seek(0)
     return StreamingResponse(
-        zip_buffer,
+        _iter_backup_zip(organization_id),
         media_type="application/zip",
         headers={"Content-Disposition": "attachment; filename=backup.zip"},
     )
@@ -352,6 +581,7 @@ def import_backup(
     organization_id: int = Form(...),
     db: Session = Depends(get_db),
     user: UserModel = Depends(get_current_user),
+    role_ids: frozenset[str] = Depends(get_current_user_role_ids),
 ):
     """
     Import backup from ZIP file.
@@ -362,9 +592,7 @@ def import_backup(
     csv.field_size_limit(10485760)  # 10MB limit
 
     # Check permission (admin only)
-    if not any(
-        role.string_id in ["admin_role", "super_admin_role"] for role in user.roles
-    ):
+    if not ADMIN_ROLE_IDS & role_ids:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have permission to import backup",
@@ -373,9 +601,7 @@ def import_backup(
     # Validate organization access
     allowed_org_ids = user.get_org_ids()
     if organization_id not in allowed_org_ids:
-        is_super_admin = any(
-            role.string_id == "super_admin_role" for role in user.roles
-        )
+        is_super_admin = "super_admin_role" in role_ids
         if not is_super_admin:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -390,17 +616,22 @@ def import_backup(
             detail="File must be a ZIP archive",
         )
 
+    zip_ref = None
     # Create temp directory
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
-            # Save uploaded file
-            zip_path = os.path.join(temp_dir, "backup.zip")
-            with open(zip_path, "wb") as f:
-                shutil.copyfileobj(file.file, f)
-
-            # Extract ZIP
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
+            # Read the ZIP straight from the spooled upload. Only attachment
+            # files are extracted to disk, as import_csv_data reads them from
+            # base_dir; CSVs are preprocessed directly from their entries.
+            file.file.seek(0)
+            zip_ref = zipfile.ZipFile(file.file, "r")
+            archive_names = set(zip_ref.namelist())
+            zip_ref.extractall(
+                temp_dir,
+                members=[
+                    name for name in archive_names if name.startswith("attachments/")
+                ],
+            )
 
             # Import order matters due to dependencies
             import_files = [
@@ -419,21 +650,25 @@ def import_backup(
             try:
                 for filename in import_files:
                     csv_path = os.path.join(temp_dir, filename)
-                    if os.path.exists(csv_path):
+                    if filename in archive_names:
                         logger.info(f"Importing {filename}...")
 
-                        # Preprocess CSV to add organization_id and owner_id
+                        # Preprocess CSV to add organization_id and owner_id,
+                        # streaming rows from the ZIP entry into the temp dir
                         try:
-                            rows = []
-                            fieldnames = []
-                            with open(csv_path, "r", encoding="utf-8") as f:
-                                reader = csv.DictReader(f)
+                            with (
+                                zip_ref.open(filename) as raw,
+                                io.TextIOWrapper(
+                                    raw, encoding="utf-8", newline=""
+                                ) as src,
+                                open(
+                                    csv_path, "w", encoding="utf-8", newline=""
+                                ) as dst,
+                            ):
+                                reader = csv.DictReader(src)
                                 fieldnames = (
                                     list(reader.fieldnames) if reader.fieldnames else []
                                 )
-                                rows = list(reader)
-
-                            if rows:
                                 if "organization_id" not in fieldnames:
                                     fieldnames.append("organization_id")
                                 if "owner_id" not in fieldnames:
@@ -451,7 +686,17 @@ def import_backup(
                                     if "user/author_id" not in fieldnames:
                                         fieldnames.append("user/author_id")
 
-                                for row in rows:
+                                logger.debug(
+                                    "Preprocessing %s: user.id=%s, org_id=%s, fieldnames=%s",
+                                    filename,
+                                    user.id,
+                                    org_id,
+                                    fieldnames,
+                                )
+
+                                writer = csv.DictWriter(dst, fieldnames=fieldnames)
+                                writer.writeheader()
+                                for row in reader:
                                     row["organization_id"] = org_id
                                     row["owner_id"] = user.id
                                     # Set user/owner_id to empty string (presence in fieldnames prevents system user default)
@@ -460,23 +705,7 @@ def import_backup(
                                     if filename == "blog_post.csv":
                                         row["author_id"] = user.id
                                         row["user/author_id"] = ""
-
-                                # Debug logging
-                                if rows:
-                                    logger.info(
-                                        f"Preprocessing {filename}: user.id={user.id}, org_id={org_id}"
-                                    )
-                                    logger.info(
-                                        f"First row after preprocessing: {rows[0]}"
-                                    )
-                                    logger.info(f"Fieldnames: {fieldnames}")
-
-                                with open(
-                                    csv_path, "w", encoding="utf-8", newline=""
-                                ) as f:
-                                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                                    writer.writeheader()
-                                    writer.writerows(rows)
+                                    writer.writerow(row)
                         except Exception as e:
                             logger.error(f"Error preprocessing {filename}: {e}")
                             raise  # Re-raise to trigger rollback
@@ -501,6 +730,28 @@ def import_backup(
                 PageContentModel = models_pool.get("page_content")
 
                 menus = db.query(MenuModel).filter_by(organization_id=org_id).all()
+
+                # Resolve every referenced page_content_string_id in one query
+                needed_string_ids = {
+                    data["page_content_string_id"]
+                    for menu in menus
+                    if menu.translations
+                    for data in menu.translations.values()
+                    if isinstance(data, dict) and data.get("page_content_string_id")
+                }
+                page_content_ids = (
+                    dict(
+                        db.query(PageContentModel.string_id, PageContentModel.id)
+                        .filter(
+                            PageContentModel.organization_id == org_id,
+                            PageContentModel.string_id.in_(needed_string_ids),
+                        )
+                        .all()
+                    )
+                    if needed_string_ids
+                    else {}
+                )
+
                 for menu in menus:
                     if not menu.translations:
                         continue
@@ -513,26 +764,23 @@ def import_backup(
                             and data["page_content_string_id"]
                         ):
                             string_id = data["page_content_string_id"]
-                            page_content = (
-                                db.query(PageContentModel)
-                                .filter_by(string_id=string_id, organization_id=org_id)
-                                .first()
-                            )
+                            page_content_id = page_content_ids.get(string_id)
 
-                            if page_content:
+                            if page_content_id:
                                 # Update the page_content_id with the correct ID from this database
                                 menu.translations[locale][
                                     "page_content_id"
-                                ] = page_content.id
+                                ] = page_content_id
                                 updated = True
                                 logger.debug(
-                                    f"Updated menu {menu.string_id} locale {locale}: page_content_id = {page_content.id}"
+                                    "Updated menu %s locale %s: page_content_id = %s",
+                                    menu.string_id,
+                                    locale,
+                                    page_content_id,
                                 )
 
                     if updated:
                         # Mark the translations field as modified so SQLAlchemy knows to update it
-                        from sqlalchemy.orm.attributes import flag_modified
-
                         flag_modified(menu, "translations")
 
                 logger.info("Menu post-processing complete")
@@ -560,3 +808,6 @@ def import_backup(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Backup import failed: {str(e)}",
             )
+        finally:
+            if zip_ref is not None:
+                zip_ref.close()
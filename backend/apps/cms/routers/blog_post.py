@@ -49,7 +49,7 @@ async def translate_content(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     org_id = user.organization_id
-    org_settings = db.query(CMSSettingsModel).get(org_id)
+    org_settings = db.get(CMSSettingsModel, org_id)
 
     return await translate_blog_content(
         content=request.content,
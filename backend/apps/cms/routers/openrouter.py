@@ -31,7 +31,7 @@ async def exchange_openrouter_code(
     current_user.check_and_raise_if_not_admin_or_super_admin()
 
     CMSSettingsModel = models_pool.get("organization")
-    org = db.query(CMSSettingsModel).get(organization_id)
+    org = db.get(CMSSettingsModel, organization_id)
     if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -63,7 +63,7 @@ def disconnect_openrouter(
     current_user.check_and_raise_if_not_admin_or_super_admin()
 
     CMSSettingsModel = models_pool.get("organization")
-    org = db.query(CMSSettingsModel).get(organization_id)
+    org = db.get(CMSSettingsModel, organization_id)
     if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -48,7 +48,7 @@ async def translate_content(
     # Get organization settings
     org_id = user.organization_id
     OrganizationModel = models_pool["organization"]
-    org_settings = db.query(OrganizationModel).get(org_id)
+    org_settings = db.get(OrganizationModel, org_id)
 
     return await translate_page_content(
         content=request.content,
@@ -103,7 +103,7 @@ async def ai_writing(
     # Get organization settings
     org_id = user.organization_id
     OrganizationModel = models_pool["organization"]
-    org_settings = db.query(OrganizationModel).get(org_id)
+    org_settings = db.get(OrganizationModel, org_id)
 
     if not org_settings:
         raise HTTPException(status_code=400, detail="Organization settings not found")
@@ -117,7 +117,7 @@ async def ai_writing(
             detail="No AI API keys configured. Please configure OpenRouter API key in site settings.",
         )
 
-    openrouter_model = db.query(models_pool["openrouter_model"]).get(request.model_id)
+    openrouter_model = db.get(models_pool["openrouter_model"], request.model_id)
 
     if not request.prompt.strip():
         raise HTTPException(status_code=400, detail="Prompt cannot be empty")
@@ -286,8 +286,9 @@ def upload_theme(
         )
 
     try:
-        contents = file.file.read()
-        zf = zipfile.ZipFile(io.BytesIO(contents))
+        # The upload is already spooled to a seekable file; read the archive
+        # from it directly rather than copying it into memory first
+        zf = zipfile.ZipFile(file.file)
     except zipfile.BadZipFile:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -373,8 +374,8 @@ def upload_theme(
             continue
         dest = os.path.join(target_path, relative)
         os.makedirs(os.path.dirname(dest), exist_ok=True)
-        with open(dest, "wb") as f:
-            f.write(zf.read(name))
+        with zf.open(name) as src, open(dest, "wb") as f:
+            shutil.copyfileobj(src, f)
 
     logger.info(
         f"Theme '{folder_name}' uploaded by {current_user.email or current_user.username}"
@@ -40,7 +40,7 @@ async def get_current_user_websocket(
     if session_id and session_store:
         session_data = session_store.get(session_id)
         if session_data is not None:
-            user = db.query(UserModel).get(session_data.user_id)
+            user = db.get(UserModel, session_data.user_id)
             if user:
                 return user
 
@@ -52,7 +52,7 @@ def get_page_content(
 
     # Use explicit org_id if provided (preview from admin), otherwise detect by domain
     if org_id:
-        org_settings = db.query(OrganizationModel).get(org_id)
+        org_settings = db.get(OrganizationModel, org_id)
     else:
         domain = detect_domain_from_request(request)
         org_settings = OrganizationModel.find_organization_by_domain(domain, db)
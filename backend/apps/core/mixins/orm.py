@@ -1,6 +1,7 @@
 import logging
 
 from fastapi import HTTPException, status
+from sqlalchemy import Index, event
 from sqlalchemy.orm import Session
 
 from deepsel.orm.mixin import ORMBaseMixin as _ORMBaseMixin
@@ -104,3 +105,20 @@ class ORMBaseMixin(_ORMBaseMixin):
         tablename = instance.__tablename__ if instance else cls.__tablename__
         if tablename == "user":
             user.check_and_raise_if_not_admin_or_super_admin()
+
+
+@event.listens_for(ORMBaseMixin, "instrument_class", propagate=True)
+def _add_string_id_organization_index(mapper, cls):
+    """Index (string_id, organization_id) on every table that has both columns.
+
+    CSV imports resolve foreign keys by filtering on both columns, so a
+    composite index lets each lookup be answered by a single index scan.
+    """
+    table = getattr(cls, "__table__", None)
+    if table is None or not {"string_id", "organization_id"} <= set(table.c.keys()):
+        return
+
+    index_name = f"ix_{table.name}_string_id_organization_id"
+    if any(index.name == index_name for index in table.indexes):
+        return
+    Index(index_name, table.c.string_id, table.c.organization_id)
@@ -18,6 +18,40 @@ class AttachmentModel(Base, AttachmentMixin, BaseModel):
     alt_text = Column(String, nullable=True)
     local_directory = os.path.join("files")
 
+    def get_local_path(self) -> str:
+        """Path of the stored file on disk for local-filesystem attachments."""
+        return os.path.join(self.local_directory, self.name)
+
+    @classmethod
+    def iter_stored_data(
+        cls, storage_type: AttachmentTypeOptions, name: str, chunk_size: int = 1 << 20
+    ):
+        """Yield a stored file in chunks from its storage type and name alone.
+
+        Takes plain values rather than an instance, so it can run in a worker
+        thread without touching a session. Closing the generator releases the
+        underlying file or HTTP stream.
+        """
+        if storage_type == AttachmentTypeOptions.local:
+            with open(os.path.join(cls.local_directory, name), "rb") as f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+        elif storage_type == AttachmentTypeOptions.s3:
+            body = cls.get_s3_client().get_object(
+                Bucket=cls._get_s3_bucket(), Key=name
+            )["Body"]
+            try:
+                yield from body.iter_chunks(chunk_size)
+            finally:
+                body.close()
+        elif storage_type == AttachmentTypeOptions.azure:
+            blob_client = cls.get_azure_blob_client().get_blob_client(
+                container=cls._get_azure_container(), blob=name
+            )
+            yield from blob_client.download_blob().chunks()
+        else:
+            raise ValueError(f"Unsupported storage type: {storage_type}")
+
     # --- AttachmentMixin settings ---
 
     @classmethod
@@ -13,5 +13,5 @@ class CountryModel(Base, ORMBaseMixin):
     iso_code = Column(String, nullable=False, unique=True)
     phone_code = Column(String)
 
-    currency_id = Column(Integer, ForeignKey("currency.id"))
+    currency_id = Column(Integer, ForeignKey("currency.id"), index=True)
     currency = relationship("CurrencyModel")
@@ -13,5 +13,5 @@ class LocaleModel(Base, ORMBaseMixin):
     id = Column(Integer, primary_key=True)
 
     name = Column(String, nullable=False)
-    iso_code = Column(String, nullable=False)
+    iso_code = Column(String, nullable=False, index=True)
     emoji_flag = Column(String)
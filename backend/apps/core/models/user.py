@@ -1,9 +1,23 @@
-from sqlalchemy import JSON, Boolean, Column, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+import json
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+    select,
+)
+from sqlalchemy.orm import deferred, object_session, relationship
 from sqlalchemy.types import UUID
 from db import Base
 from apps.core.mixins.orm import ORMBaseMixin
 from deepsel.orm.user_mixin import UserMixin
+from deepsel.utils.crypto import decrypt as _decrypt
+from settings import APP_SECRET
 
 
 class UserModel(Base, UserMixin, ORMBaseMixin):
@@ -15,6 +29,9 @@ class UserModel(Base, UserMixin, ORMBaseMixin):
     username = Column(String, unique=True)
     email = Column(String, unique=True, nullable=False)
 
+    # case-insensitive username lookups filter on lower(username)
+    __table_args__ = (Index("ix_user_username_lower", func.lower(username)),)
+
     # profile fields
     name = Column(String)
     last_name = Column(String)
@@ -32,7 +49,10 @@ class UserModel(Base, UserMixin, ORMBaseMixin):
     state = Column(String)
     zip = Column(String)
     country = Column(String)
-    hashed_password = Column(String)
+    # Credential columns are not part of any read schema; defer them as one
+    # group so the per-request user load (get_current_user) skips them and
+    # login/2FA code loads all of them together on first access
+    hashed_password = deferred(Column(String), group="credentials")
     signed_up = Column(Boolean, default=False)
     internal = Column(Boolean, default=False, nullable=False)
     device_info = Column(JSON)
@@ -50,15 +70,105 @@ class UserModel(Base, UserMixin, ORMBaseMixin):
     cv = relationship("AttachmentModel", foreign_keys=[cv_attachment_id])
 
     is_use_2fa = Column(Boolean, default=False)
-    secret_key_2fa = Column(String)
-    temp_secret_key_2fa = Column(String)
-    recovery_codes = Column(JSON, nullable=True)
+    secret_key_2fa = deferred(Column(String), group="credentials")
+    temp_secret_key_2fa = deferred(Column(String), group="credentials")
+    recovery_codes = deferred(Column(JSON, nullable=True), group="credentials")
 
     google_id = Column(String)
     saml_nameid = Column(String)
     anonymous_id = Column(UUID(as_uuid=True))
     preferences = Column(JSON, default={})
 
+    # --- Decrypted 2FA secrets ---
+
+    def _decrypt_2fa_secret(self, encrypted):
+        """Decrypt a stored 2FA secret, memoized on the instance by ciphertext.
+
+        Keying on the ciphertext means a secret that is replaced during the
+        request is decrypted again rather than served stale.
+        """
+        if not encrypted:
+            return None
+        cache = self.__dict__.setdefault("_decrypted_2fa_secrets", {})
+        if encrypted not in cache:
+            secret = _decrypt(encrypted, APP_SECRET)
+            if isinstance(secret, bytes):
+                secret = secret.decode("utf-8")
+            cache[encrypted] = secret
+        return cache[encrypted]
+
+    @property
+    def secret_key_2fa_plain(self):
+        return self._decrypt_2fa_secret(self.secret_key_2fa)
+
+    @property
+    def temp_secret_key_2fa_plain(self):
+        return self._decrypt_2fa_secret(self.temp_secret_key_2fa)
+
+    def _implied_role_ids(self):
+        """Recursive CTE of the user's assigned role ids plus all implied ones."""
+        from apps.core.models.implied_role import ImpliedRoleModel
+        from apps.core.models.user_role import UserRoleModel
+
+        role_ids = (
+            select(UserRoleModel.role_id.label("id"))
+            .where(UserRoleModel.user_id == self.id)
+            .cte("role_ids", recursive=True)
+        )
+        # UNION (not UNION ALL) drops rows already seen, so cycles terminate
+        return role_ids.union(
+            select(ImpliedRoleModel.implied_role_id).join(
+                role_ids, ImpliedRoleModel.role_id == role_ids.c.id
+            )
+        )
+
+    def get_user_roles(self, user=None):
+        """Return assigned roles plus all transitively implied roles.
+
+        Resolves the implied-role graph with one recursive CTE instead of
+        lazy-loading `implied_roles` level by level.
+        """
+        user = user or self
+        db = object_session(user)
+        if db is None or user.id is None:
+            return super().get_user_roles(user)
+
+        from apps.core.models.role import RoleModel
+
+        role_ids = user._implied_role_ids()
+        return (
+            db.query(RoleModel)
+            .filter(RoleModel.id.in_(select(role_ids.c.id)))
+            .order_by(RoleModel.id)
+            .all()
+        )
+
+    def get_user_permissions(self, user=None):
+        """Return the union of permissions over all assigned and implied roles.
+
+        Reads only the permissions column of the roles in the same recursive
+        CTE as get_user_roles, in a single query.
+        """
+        user = user or self
+        db = object_session(user)
+        if db is None or user.id is None:
+            return super().get_user_permissions(user)
+
+        from apps.core.models.role import RoleModel
+
+        role_ids = user._implied_role_ids()
+        rows = db.execute(
+            select(RoleModel.permissions).where(
+                RoleModel.id.in_(select(role_ids.c.id)),
+                RoleModel.permissions.is_not(None),
+            )
+        ).scalars()
+        permissions = set()
+        for role_permissions in rows:
+            if role_permissions:
+                permissions.update(json.loads(role_permissions))
+        return list(permissions)
+
     # --- UserMixin settings ---
 
     @classmethod
@@ -1,6 +1,9 @@
 from fastapi import APIRouter, Depends
 from settings import installed_apps
-from apps.core.utils.get_current_user import get_current_user
+from apps.core.utils.get_current_user import (
+    ADMIN_ROLE_IDS,
+    get_current_user_role_ids,
+)
 from sqlalchemy.orm import Session
 from apps.core.utils.models_pool import models_pool
 from db import get_db
@@ -17,11 +20,9 @@ UserModel = models_pool["user"]
 
 
 @router.post("/search", response_model=GetAppsResponse)
-def get_apps(user: UserModel = Depends(get_current_user)):
+def get_apps(role_ids: frozenset[str] = Depends(get_current_user_role_ids)):
     # check if user has Admin or Super Admin role
-    if not any(
-        role.string_id in ["admin_role", "super_admin_role"] for role in user.roles
-    ):
+    if not ADMIN_ROLE_IDS & role_ids:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have permission to read this resource type",
@@ -36,13 +37,11 @@ def get_apps(user: UserModel = Depends(get_current_user)):
 )
 def load_demo_data(
     app_name: str,
-    user: UserModel = Depends(get_current_user),
+    role_ids: frozenset[str] = Depends(get_current_user_role_ids),
     db: Session = Depends(get_db),
 ):
     # check if user has Admin or Super Admin role
-    if not any(
-        role.string_id in ["admin_role", "super_admin_role"] for role in user.roles
-    ):
+    if not ADMIN_ROLE_IDS & role_ids:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have permission to read this resource type",
@@ -71,17 +70,27 @@ def load_demo_data(
             detail="This module does not have demo data configured.",
         )
 
+    # Import every file in one transaction so a failure part-way through
+    # does not leave half of the demo data committed
     try:
         app_folder = f"apps/{app_name}"
         for file in import_order:
-            import_csv_data(f"{app_folder}/demo_data/{file}", db, demo_data=True)
+            import_csv_data(
+                f"{app_folder}/demo_data/{file}",
+                db,
+                demo_data=True,
+                auto_commit=False,
+            )
+        db.commit()
     # catch unique constraint violation error
     except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Some data with unique constraints already exists in the database.",
         )
     except Exception as e:
+        db.rollback()
         logger.error(e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
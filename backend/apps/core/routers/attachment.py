@@ -1,7 +1,7 @@
 import os
 
 from fastapi import Depends, File, Response, UploadFile, status, HTTPException
-from fastapi.responses import RedirectResponse
+from fastapi.responses import FileResponse, RedirectResponse
 from sqlalchemy.orm import Session
 from settings import UPLOAD_SIZE_LIMIT
 from db import get_db
@@ -11,6 +11,7 @@ from apps.core.utils.get_current_user import (
     get_current_user_optional,
 )
 from apps.core.utils.models_pool import models_pool
+from deepsel.orm.attachment_mixin import AttachmentTypeOptions
 from apps.core.schemas.attachment import (
     AttachmentRead,
     AttachmentUpdate,
@@ -86,6 +87,13 @@ def serve_file(
             status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
         )
 
+    # Local files are streamed from disk (sendfile where available) instead of
+    # being read fully into memory by get_serve_result()
+    if instance.type == AttachmentTypeOptions.local:
+        local_path = instance.get_local_path()
+        if os.path.isfile(local_path):
+            return FileResponse(local_path, media_type=instance.content_type)
+
     result = instance.get_serve_result()
     if result.redirect_url:
         return RedirectResponse(url=result.redirect_url, status_code=302)
@@ -1,11 +1,17 @@
+import asyncio
+import logging
+
 from deepsel.utils.crud_router import CRUDRouter
 from apps.core.schemas.cron import CronRead, CronCreate, CronUpdate, CronSearch
 from apps.core.utils.get_current_user import get_current_user
-from fastapi import Depends, HTTPException
-from db import get_db
+from fastapi import BackgroundTasks, Depends, HTTPException
+from db import engine, get_db, get_db_context
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from apps.core.utils.models_pool import models_pool
 
+logger = logging.getLogger(__name__)
+
 table_name = "cron"
 Model = models_pool[table_name]
 
@@ -19,14 +25,46 @@ router = CRUDRouter(
 )
 
 
+def _run_cron_in_new_session(cron_id: int):
+    # A plain def, so Starlette runs it in the threadpool instead of blocking
+    # the event loop on the lock connection and the cron's own queries.
+    # The advisory lock is keyed on the cron id, same as execute_cron.py, so
+    # manual and scheduled runs exclude each other. It is transaction-scoped
+    # on a dedicated connection whose transaction stays open for the run:
+    # cron.execute() commits its own session, and the lock is released
+    # automatically when this transaction ends.
+    with engine.begin() as lock_conn:
+        obtained = lock_conn.execute(
+            text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": cron_id}
+        ).scalar()
+        if not obtained:
+            logger.warning("Cron %s is already running, skipped manual run", cron_id)
+            return
+
+        # The request session is closed once the response is sent, so the
+        # background run needs its own
+        with get_db_context() as db:
+            cron = db.get(Model, cron_id)
+            if cron:
+                asyncio.run(cron.execute(db))
+
+
 @router.get("/execute/{id}")
 async def execute_cron(
-    id: int, db: Session = Depends(get_db), user=Depends(get_current_user)
+    id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
 ):
-    cron = db.query(Model).get(id)
+    cron = db.get(Model, id)
     if not cron:
-        return HTTPException(status_code=404, detail="Cron not found")
+        raise HTTPException(status_code=404, detail="Cron not found")
 
-    await cron.execute(db)
+    # The advisory lock is only tried once the task runs; a run that finds it
+    # held logs a warning and is skipped, so the response says so up front
+    background_tasks.add_task(_run_cron_in_new_session, id)
 
-    return {"message": "Cron executed successfully!"}
+    return {
+        "message": "Cron scheduled successfully! It is skipped if a run is "
+        "already in progress."
+    }
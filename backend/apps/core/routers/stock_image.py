@@ -1,4 +1,7 @@
 import logging
+import threading
+import time
+from collections import OrderedDict
 
 from fastapi import Depends, HTTPException
 
@@ -22,15 +25,48 @@ router = create_api_router(
     dependencies=[Depends(get_current_user)],
 )
 
+# In-process cache of provider search results, so the editor re-issuing the
+# same search (retyping, paging back and forth) does not hit the provider API
+SEARCH_CACHE_TTL = 600  # seconds
+SEARCH_CACHE_MAX_SIZE = 1024
+
+_search_cache: OrderedDict = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _cached_search(provider: str, query_str: str, page: int, per_page: int, fetch):
+    key = (provider, query_str.strip().lower(), page, per_page)
+    now = time.monotonic()
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _search_cache.move_to_end(key)
+            return entry[1]
+
+    result = fetch()
+
+    with _search_cache_lock:
+        _search_cache[key] = (now + SEARCH_CACHE_TTL, result)
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > SEARCH_CACHE_MAX_SIZE:
+            _search_cache.popitem(last=False)
+    return result
+
 
 @router.post("/search")
 def search_stock_images(request: SearchStockImagesRequest):
     """Search stock images from the configured provider."""
     if request.provider == StockImageProviderEnum.Unsplash.value:
-        return search_unsplash_provider(
-            query_str=request.query_str,
-            page=request.page,
-            per_page=request.per_page,
+        return _cached_search(
+            request.provider,
+            request.query_str,
+            request.page,
+            request.per_page,
+            lambda: search_unsplash_provider(
+                query_str=request.query_str,
+                page=request.page,
+                per_page=request.per_page,
+            ),
         )
     raise HTTPException(status_code=400, detail="Invalid provider")
 
@@ -1,23 +1,32 @@
+import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, Any
+import orjson
 import pyotp
-from fastapi import BackgroundTasks, Body, Depends, HTTPException, status
+from fastapi import BackgroundTasks, Body, Depends, HTTPException, Request, status
+from fastapi.responses import Response
+from pydantic import BaseModel
+from sqlalchemy import exists, func
 from sqlalchemy.orm import Session
-from db import get_db
+from db import get_db, get_db_context
 from settings import APP_SECRET
 from deepsel.utils.crypto import (
     encrypt as _encrypt,
-    decrypt as _decrypt,
     generate_recovery_codes,
     hash_text,
 )
 from deepsel.utils.crud_router import CALLABLE, CRUDRouter
 from apps.core.utils.get_current_user import get_current_user
+from apps.core.utils.totp import provisioning_uri, verify_totp
 from apps.core.utils.models_pool import models_pool
 from apps.core.schemas.user import (
     CurrentUser,
     Info2Fa,
+    UserAttachmentRead,
+    UserOrganizationRead,
+    UserRoleRead,
     UserRead,
     UserSearch,
     UserCreate,
@@ -32,6 +41,26 @@ RoleModel = models_pool["role"]
 EmailTemplateModel = models_pool["email_template"]
 OrganizationModel = models_pool["organization"]
 
+# bcrypt releases the GIL while hashing, so recovery codes are hashed on a
+# small pool shared by all requests rather than threads spawned per request
+RECOVERY_CODE_HASH_WORKERS = 4
+_recovery_code_hasher = ThreadPoolExecutor(
+    max_workers=RECOVERY_CODE_HASH_WORKERS, thread_name_prefix="recovery-code-hash"
+)
+
+
+async def _send_set_password_email(user_id: int):
+    """Send the password setup email from a session owned by the task.
+
+    Only the id is handed over, so the request session can be released as
+    soon as the response is sent.
+    """
+    with get_db_context() as db:
+        new_user = db.get(Model, user_id)
+        if new_user is None:
+            return
+        await new_user.send_set_password_email(db)
+
 
 class UserCustomRouter(CRUDRouter):
     def _create(self, *args: Any, **kwargs: Any) -> CALLABLE:
@@ -41,11 +70,14 @@ class UserCustomRouter(CRUDRouter):
             db: Session = Depends(self.db_func),
             user: Model = Depends(get_current_user),
         ) -> [Model]:
-            values = model.dict()
+            values = model.model_dump()
             username = values.get("username")
             if username:
                 # check if username already exists, including lowercase
-                if db.query(Model).filter(Model.username.ilike(username)).first():
+                username_taken = db.query(
+                    exists().where(func.lower(Model.username) == username.lower())
+                ).scalar()
+                if username_taken:
                     raise HTTPException(
                         status_code=status.HTTP_409_CONFLICT,
                         detail="Username already exists",
@@ -59,7 +91,7 @@ class UserCustomRouter(CRUDRouter):
                 db.commit()
             else:
                 # send password setup email to new user
-                background_tasks.add_task(new_user.send_set_password_email, db)
+                background_tasks.add_task(_send_set_password_email, new_user.id)
 
             return new_user
 
@@ -76,19 +108,111 @@ router = UserCustomRouter(
 )
 
 
+# Field names of the read schemas used by get_me, computed once at import.
+# CurrentUser only adds permissions/all_roles on top of UserRead.
+_READ_FIELDS = tuple(UserRead.model_fields)
+_ROLE_FIELDS = tuple(UserRoleRead.model_fields)
+_ATTACHMENT_FIELDS = tuple(UserAttachmentRead.model_fields)
+_ORGANIZATION_FIELDS = tuple(UserOrganizationRead.model_fields)
+
+# Nested relationship fields of UserRead and the schema each row maps to
+_NESTED_READ_SCHEMAS = {
+    "image": (UserAttachmentRead, _ATTACHMENT_FIELDS),
+    "cv": (UserAttachmentRead, _ATTACHMENT_FIELDS),
+    "organization": (UserOrganizationRead, _ORGANIZATION_FIELDS),
+    "organizations": (UserOrganizationRead, _ORGANIZATION_FIELDS),
+    "roles": (UserRoleRead, _ROLE_FIELDS),
+}
+
+_MISSING = object()
+
+
+def _construct_from_orm(
+    schema: type[BaseModel],
+    fields: tuple[str, ...],
+    obj,
+    nested: dict = None,
+    **extra: Any,
+):
+    """Build `schema` from a trusted ORM row using model_construct.
+
+    The data comes straight from the database, so per-field validation is
+    skipped. Attributes missing on `obj` fall back to the schema defaults.
+    """
+    values = {}
+    for field in fields:
+        value = getattr(obj, field, _MISSING)
+        if value is _MISSING:
+            continue
+        if nested and value is not None and field in nested:
+            nested_schema, nested_fields = nested[field]
+            if isinstance(value, list):
+                value = [
+                    _construct_from_orm(nested_schema, nested_fields, item)
+                    for item in value
+                ]
+            else:
+                value = _construct_from_orm(nested_schema, nested_fields, value)
+        values[field] = value
+    values.update(extra)
+    return schema.model_construct(**values)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches `etag` (RFC 9110 section 13.1.2).
+
+    The header may list several entity tags, and If-None-Match uses weak
+    comparison, so a W/ prefix is ignored on either side.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _revalidated_response(request: Request, content: dict) -> Response:
+    """Return `content` as JSON with an ETag, or 304 if the client has it.
+
+    The ETag hashes the serialized body, so the payload (including role and
+    permission resolution) is still built on every request; a 304 only saves
+    sending it. A cheaper validator such as user.updated_at would miss role,
+    permission and organization edits. no-cache keeps the browser from
+    serving a stale copy after a role or 2FA change, or after switching users.
+    """
+    body = orjson.dumps(content)
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/util/me", response_model=CurrentUser)
-def get_me(user: Model = Depends(get_current_user)):
+def get_me(request: Request, user: Model = Depends(get_current_user)):
     permissions = user.get_user_permissions()
     all_roles = (
         user.get_user_roles()
     )  # list of all explicitly assigned roles and implied roles, recursively
 
-    current_user = CurrentUser(
-        **UserRead.model_validate(user).model_dump(),  # return without password
+    # UserRead has no password field, so only public columns are copied
+    current_user = _construct_from_orm(
+        CurrentUser,
+        _READ_FIELDS,
+        user,
+        _NESTED_READ_SCHEMAS,
         permissions=permissions,
-        all_roles=all_roles,
+        all_roles=[
+            _construct_from_orm(UserRoleRead, _ROLE_FIELDS, role) for role in all_roles
+        ],
     )
-    return current_user
+    # Returning a Response skips FastAPI's response_model re-validation; the
+    # response_model is kept for the OpenAPI schema only
+    return _revalidated_response(request, current_user.model_dump())
 
 
 @router.put("/me/2fa-config")
@@ -111,8 +235,10 @@ def update_2fa_config(
         user.temp_secret_key_2fa = _encrypt(secret_key, APP_SECRET)
         db.commit()
 
-        totp_uri = pyotp.totp.TOTP(secret_key).provisioning_uri(
-            name=user.email or user.username, issuer_name=user.organization.name
+        totp_uri = provisioning_uri(
+            secret_key,
+            name=user.email or user.username,
+            issuer_name=user.organization.name,
         )
         return Info2Fa(totp_uri=totp_uri)
 
@@ -129,12 +255,7 @@ def update_2fa_config(
                 detail="OTP is required",
             )
 
-        temp_secret = _decrypt(user.temp_secret_key_2fa, APP_SECRET)
-        if isinstance(temp_secret, bytes):
-            temp_secret = temp_secret.decode("utf-8")
-
-        totp = pyotp.TOTP(temp_secret)
-        if not totp.verify(otp):
+        if not verify_totp(user.temp_secret_key_2fa_plain, otp):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Invalid OTP. Please scan the QR code and try again.",
@@ -147,7 +268,7 @@ def update_2fa_config(
 
         # Generate recovery codes
         recovery_codes = generate_recovery_codes()
-        hashed_codes = [hash_text(code) for code in recovery_codes]
+        hashed_codes = list(_recovery_code_hasher.map(hash_text, recovery_codes))
         user.recovery_codes = json.dumps(hashed_codes)
         db.commit()
 
@@ -165,12 +286,7 @@ def update_2fa_config(
                 detail="OTP is required to disable 2FA",
             )
 
-        secret = _decrypt(user.secret_key_2fa, APP_SECRET)
-        if isinstance(secret, bytes):
-            secret = secret.decode("utf-8")
-
-        totp = pyotp.TOTP(secret)
-        if not totp.verify(otp):
+        if not verify_totp(user.secret_key_2fa_plain, otp):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Invalid OTP",
@@ -191,8 +307,11 @@ def update_2fa_config(
         )
 
 
-@router.get("/me/2fa-config")
+@router.get("/me/2fa-config", response_model=Info2Fa)
 def get_2fa_config(
+    request: Request,
     user: Model = Depends(get_current_user),
-) -> Info2Fa:
-    return Info2Fa(is_use_2fa=user.is_use_2fa)
+):
+    return _revalidated_response(
+        request, Info2Fa(is_use_2fa=user.is_use_2fa).model_dump()
+    )
@@ -45,7 +45,13 @@ def delete_check(
     elif model == "xray_event":
         model = "tracking_event"
 
-    ids = ids.split(",")
+    # Typed ids bind as integers, matching the primary key column type
+    try:
+        ids = [int(record_id) for record_id in ids.split(",")]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid ids"
+        ) from None
 
     Model = models_pool.get(model, None)
     if Model is None:
@@ -76,7 +82,7 @@ def delete_check(
 
 
 @router.get("/health", response_model=HealthResponse)
-def health():
+async def health():
     return HealthResponse(status="ok")
 
 
@@ -105,38 +111,23 @@ def get_public_settings_by_domain(
     else:
         # Fallback logic for basic organization detection
         organizations = db.query(OrganizationModel).all()
-        org_settings = None
-
-        logger.info(f"Found {len(organizations)} organizations total")
 
-        # First try exact domain match
+        # domain -> first organization listing it, so the exact and wildcard
+        # matches below are dict lookups
+        orgs_by_domain = {}
         for org in organizations:
-            logger.info(
-                f"Org ID {org.id}: domains={getattr(org, 'domains', None)}, name='{getattr(org, 'name', 'Unknown')}'"
-            )
-            if hasattr(org, "domains") and org.domains and domain in org.domains:
-                logger.info(
-                    f"EXACT MATCH: Found organization {org.id} for domain '{domain}'"
-                )
-                org_settings = org
-                break
+            for org_domain in getattr(org, "domains", None) or []:
+                orgs_by_domain.setdefault(org_domain, org)
 
-        # Fallback to wildcard organization
-        if not org_settings:
-            for org in organizations:
-                if hasattr(org, "domains") and org.domains and "*" in org.domains:
-                    logger.info(
-                        f"WILDCARD MATCH: Using organization {org.id} with wildcard domain"
-                    )
-                    org_settings = org
-                    break
+        # First try exact domain match, then the wildcard organization
+        org_settings = orgs_by_domain.get(domain) or orgs_by_domain.get("*")
 
         # Final fallback - get first organization
         if not org_settings:
             org_settings = organizations[0] if organizations else None
             if org_settings:
                 logger.info(
-                    f"DEFAULT FALLBACK: Using first organization {org_settings.id}"
+                    "DEFAULT FALLBACK: Using first organization %s", org_settings.id
                 )
             else:
                 logger.error("No organizations found in database!")
@@ -1,99 +1,87 @@
-import uuid
 import pytest
-import psycopg
 from testcontainers.postgres import PostgresContainer
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 from fastapi.testclient import TestClient
 
 
 @pytest.fixture(scope="session")
 def pg_container():
-    """Start a Postgres container for the entire test session."""
-    with PostgresContainer("postgres:16", driver="psycopg") as pg:
+    """Start a Postgres container for the entire test session.
+
+    Each xdist worker runs its own session and so its own container; sharing
+    one would tie every worker to the lifetime of whichever started it.
+    """
+    # Test data is disposable, so skip the WAL flushes durability needs
+    with PostgresContainer("postgres:16", driver="psycopg").with_command(
+        "postgres -c fsync=off -c synchronous_commit=off -c full_page_writes=off"
+    ) as pg:
         yield pg
 
 
 @pytest.fixture(scope="session")
 def pg_url(pg_container):
-    """Get the SQLAlchemy connection URL for the Postgres container."""
-    return pg_container.get_connection_url()
-
-
-@pytest.fixture
-def raw_pg_url(pg_url):
-    """Get raw PostgreSQL URL without SQLAlchemy driver prefix."""
-    return pg_url.replace("postgresql+psycopg://", "postgresql://")
+    """SQLAlchemy URL of the container's database.
 
-
-@pytest.fixture
-def pg_conn(raw_pg_url):
-    """Create a new Postgres connection per test with autocommit disabled."""
-    with psycopg.connect(raw_pg_url, autocommit=False) as conn:
-        yield conn
-        conn.rollback()
+    Each xdist worker has its own container, so its database is already
+    isolated from the other workers'.
+    """
+    return pg_container.get_connection_url()
 
 
-@pytest.fixture
-def isolated_schema(pg_conn):
-    """Create an isolated schema for each test to avoid conflicts."""
-    schema_name = f"test_{uuid.uuid4().hex[:12]}"
-    pg_conn.execute(f'CREATE SCHEMA "{schema_name}"')
-    pg_conn.execute(f'SET search_path TO "{schema_name}"')
-    pg_conn.commit()
-
-    yield schema_name
+@pytest.fixture(scope="session")
+def engine(pg_url):
+    """Engine shared by the whole session, with all tables created once."""
+    from db import Base
 
-    pg_conn.execute(f'DROP SCHEMA "{schema_name}" CASCADE')
-    pg_conn.commit()
+    engine = create_engine(pg_url)
+    # Tables are created here rather than cloned from a template database:
+    # with one container per xdist worker, a template would be built and
+    # cloned exactly once and never reused. The database is new and empty,
+    # so skip the per-table existence checks.
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn, checkfirst=False)
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
-def db(pg_url, isolated_schema):
-    """SQLAlchemy session bound to an isolated per-test schema."""
-    db_url = f"{pg_url}?options=-c%20search_path%3D{isolated_schema}"
-    engine = create_engine(db_url)
-
-    # Create all tables in the isolated schema
-    from db import Base
-
-    Base.metadata.create_all(engine)
-
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = SessionLocal()
+def db(engine):
+    """SQLAlchemy session inside a transaction that is rolled back afterwards.
+
+    The session joins the outer transaction through savepoints, so commit()
+    and rollback() in tests only release or roll back a SAVEPOINT.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection, autoflush=False, join_transaction_mode="create_savepoint"
+    )
     try:
         yield session
     finally:
         session.close()
-        engine.dispose()
+        transaction.rollback()
+        connection.close()
 
 
-@pytest.fixture
-def app(pg_url, isolated_schema):
-    """FastAPI TestClient with DB overridden to use testcontainers DB."""
+@pytest.fixture(scope="session")
+def client(engine):
+    """TestClient shared by the session, so app startup and shutdown run once."""
     from main import app as fastapi_app
-    from db import get_db
 
-    db_url = f"{pg_url}?options=-c%20search_path%3D{isolated_schema}"
-    engine = create_engine(db_url)
-
-    from db import Base
+    with TestClient(fastapi_app) as client:
+        yield client
 
-    Base.metadata.create_all(engine)
 
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@pytest.fixture
+def app(client, db):
+    """Shared TestClient with get_db overridden to use the test's session."""
+    from db import get_db
 
     def override_get_db():
-        session = SessionLocal()
-        try:
-            yield session
-        finally:
-            session.close()
+        yield db
 
-    fastapi_app.dependency_overrides[get_db] = override_get_db
-
-    with TestClient(fastapi_app) as client:
-        yield client
-
-    fastapi_app.dependency_overrides.clear()
-    engine.dispose()
+    client.app.dependency_overrides[get_db] = override_get_db
+    yield client
+    client.app.dependency_overrides.pop(get_db, None)
@@ -38,7 +38,7 @@ def test_delete_user(db: Session):
     user_id = user.id
     db.delete(user)
     db.commit()
-    deleted_user = db.query(UserModel).get(user_id)
+    deleted_user = db.get(UserModel, user_id)
     assert deleted_user is None  # nosec B101
 
 
@@ -49,6 +49,36 @@ def test_update_user(db: Session):
     user.username = "Updated User"
     user.email = "updated@test.com"
     db.commit()
-    updated_user = db.query(UserModel).get(user.id)
+    updated_user = db.get(UserModel, user.id)
     assert updated_user.username == "Updated User"  # nosec B101
     assert updated_user.email == "updated@test.com"  # nosec B101
+
+
+def test_user_roles_and_permissions_follow_implied_roles(db: Session):
+    OrganizationModel = models_pool["organization"]
+    RoleModel = models_pool["role"]
+
+    org = OrganizationModel(name="Role Org")
+    db.add(org)
+    db.flush()
+    viewer = RoleModel(
+        name="Viewer", permissions='["page:read:org"]', organization_id=org.id
+    )
+    editor = RoleModel(
+        name="Editor", permissions='["page:write:org"]', organization_id=org.id
+    )
+    editor.implied_roles = [viewer]
+    # cycle back to editor must not loop forever
+    viewer.implied_roles = [editor]
+    user = UserModel(username="Role User", email="roles@test.com", roles=[editor])
+    db.add_all([viewer, editor, user])
+    db.commit()
+
+    roles = user.get_user_roles()
+    assert {role.id for role in roles} == {viewer.id, editor.id}  # nosec B101
+    assert sorted(user.get_user_permissions()) == [  # nosec B101
+        "page:read:org",
+        "page:write:org",
+    ]
+    other = UserModel(username="Other User", email="other@test.com")
+    assert len(other.get_user_roles(user)) == 2  # nosec B101
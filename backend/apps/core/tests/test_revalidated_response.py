@@ -0,0 +1,39 @@
+from starlette.requests import Request
+
+from apps.core.routers.user import _etag_matches, _revalidated_response
+
+CONTENT = {"id": 1, "username": "admin"}
+
+
+def _request(if_none_match: str = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode("latin-1")))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_revalidated_response_returns_body_and_etag():
+    response = _revalidated_response(_request(), CONTENT)
+    assert response.status_code == 200  # nosec B101
+    assert response.headers["etag"].startswith('"')  # nosec B101
+    assert response.headers["cache-control"] == "private, no-cache"  # nosec B101
+
+
+def test_revalidated_response_returns_304_for_matching_etag():
+    etag = _revalidated_response(_request(), CONTENT).headers["etag"]
+    for if_none_match in [etag, f"W/{etag}", f'"other", {etag}', "*"]:
+        response = _revalidated_response(_request(if_none_match), CONTENT)
+        assert response.status_code == 304  # nosec B101
+        assert response.body == b""  # nosec B101
+        assert response.headers["etag"] == etag  # nosec B101
+
+
+def test_revalidated_response_ignores_stale_etag():
+    response = _revalidated_response(_request('"stale", W/"older"'), CONTENT)
+    assert response.status_code == 200  # nosec B101
+
+
+def test_etag_matches():
+    assert _etag_matches('W/"a" , "b"', '"b"')  # nosec B101
+    assert not _etag_matches(None, '"a"')  # nosec B101
+    assert not _etag_matches('"ab"', '"a"')  # nosec B101
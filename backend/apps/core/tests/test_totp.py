@@ -0,0 +1,44 @@
+import base64
+
+from apps.core.utils.totp import provisioning_uri, verify_totp
+
+# RFC 6238 appendix B SHA-1 test secret; the expected 8-digit values are
+# truncated to their last 6 digits, as 6-digit codes use the same counter
+SECRET = base64.b32encode(b"12345678901234567890").decode("utf-8")
+
+
+def test_verify_totp_rfc_vectors():
+    for for_time, expected in [
+        (59, "94287082"),
+        (1111111109, "07081804"),
+        (1234567890, "89005924"),
+        (2000000000, "69279037"),
+    ]:
+        assert verify_totp(SECRET, expected[-6:], for_time=for_time)  # nosec B101
+
+
+def test_verify_totp_rejects_wrong_code():
+    assert not verify_totp(SECRET, "000000", for_time=59)  # nosec B101
+    assert not verify_totp(SECRET, "", for_time=59)  # nosec B101
+
+
+def test_verify_totp_rejects_non_digit_code():
+    # non-ASCII input must be a clean rejection, not a TypeError
+    assert not verify_totp(SECRET, "２８７０８２", for_time=59)  # nosec B101
+    assert not verify_totp(SECRET, "28708é", for_time=59)  # nosec B101
+    assert not verify_totp(SECRET, "28708", for_time=59)  # nosec B101
+    assert not verify_totp(SECRET, " 287082", for_time=59)  # nosec B101
+
+
+def test_verify_totp_valid_window():
+    # code for t=59 is in the previous interval at t=61
+    assert not verify_totp(SECRET, "287082", for_time=61)  # nosec B101
+    assert verify_totp(SECRET, "287082", for_time=61, valid_window=1)  # nosec B101
+
+
+def test_provisioning_uri():
+    uri = provisioning_uri("JBSWY3DPEHPK3PXP", "user@test.com", "Test Org")
+    assert uri == (  # nosec B101
+        "otpauth://totp/Test%20Org:user%40test.com"
+        "?secret=JBSWY3DPEHPK3PXP&issuer=Test%20Org"
+    )
@@ -5,7 +5,7 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from deepsel.utils.api_router import get_api_prefix
 from jwt import PyJWTError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from settings import (
     APP_SECRET,
@@ -17,6 +17,8 @@ from settings import (
 from db import get_db
 from apps.core.utils.models_pool import models_pool
 
+ADMIN_ROLE_IDS = frozenset({"admin_role", "super_admin_role"})
+
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f"{get_api_prefix()}/token", auto_error=False
 )
@@ -27,6 +29,16 @@ def _get_session_store(request: Request):
     return getattr(request.app.state, "session_store", None)
 
 
+def _load_user(db: Session, user_id):
+    """Load a user with its organization joined in the same SELECT.
+
+    Many endpoints (2FA, settings) read `user.organization`; joining it here
+    avoids a lazy load on each of those requests.
+    """
+    UserModel = models_pool["user"]
+    return db.get(UserModel, user_id, options=[joinedload(UserModel.organization)])
+
+
 def _resolve_user_from_session(request: Request, db: Session):
     """Try to authenticate via session cookie. Returns user or None."""
     session_id = request.cookies.get(SESSION_COOKIE_NAME)
@@ -41,9 +53,7 @@ def _resolve_user_from_session(request: Request, db: Session):
     if session_data is None:
         return None
 
-    UserModel = models_pool["user"]
-    user = db.query(UserModel).get(session_data.user_id)
-    return user
+    return _load_user(db, session_data.user_id)
 
 
 def get_current_user(
@@ -53,12 +63,13 @@ def get_current_user(
 ):
     UserModel = models_pool["user"]
     OrgModel = models_pool["organization"]
-    org = db.query(OrgModel).get(DEFAULT_ORG_ID)
+    org = db.get(OrgModel, DEFAULT_ORG_ID)
 
     if AUTHLESS and org and not org.enable_auth:
         # Return admin user when AUTHLESS=True
         user = (
             db.query(UserModel)
+            .options(joinedload(UserModel.organization))
             .filter_by(
                 string_id="admin_user",
             )
@@ -99,7 +110,7 @@ def get_current_user(
             detail="Invalid credentials",
         )
 
-    user = db.query(UserModel).get(owner_id)
+    user = _load_user(db, owner_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -115,6 +126,17 @@ def get_current_user(
     return user
 
 
+def get_current_user_role_ids(
+    user=Depends(get_current_user),
+) -> frozenset[str]:
+    """string_ids of the roles directly assigned to the current user.
+
+    Resolved once per request, so admin checks are set lookups instead of a
+    scan over `user.roles` in every handler.
+    """
+    return frozenset(role.string_id for role in user.roles)
+
+
 def get_current_user_optional(
     request: Request,
     token: Optional[str] = Depends(oauth2_scheme),
@@ -124,8 +146,6 @@ def get_current_user_optional(
     Optional authentication - returns user if authenticated, None if not.
     Does not raise exceptions for missing or invalid tokens.
     """
-    UserModel = models_pool["user"]
-
     # 1. Try session cookie
     session_user = _resolve_user_from_session(request, db)
     if session_user is not None:
@@ -143,7 +163,7 @@ def get_current_user_optional(
     except PyJWTError:
         return None
 
-    user = db.query(UserModel).get(owner_id)
+    user = _load_user(db, owner_id)
     if user is None:
         return None
 
@@ -0,0 +1,59 @@
+"""RFC 6238 TOTP helpers that avoid constructing pyotp objects per call."""
+
+import base64
+import hashlib
+import hmac
+import struct
+import time
+from urllib.parse import quote, urlencode
+
+TOTP_INTERVAL = 30
+TOTP_DIGITS = 6
+_MODULUS = 10**TOTP_DIGITS
+
+
+def _decode_secret(secret_b32: str) -> bytes:
+    secret_b32 = secret_b32.upper()
+    return base64.b32decode(secret_b32 + "=" * (-len(secret_b32) % 8))
+
+
+def _hotp(key: bytes, counter: int) -> str:
+    digest = hmac.new(key, struct.pack(">Q", counter), hashlib.sha1).digest()
+    offset = digest[-1] & 0x0F
+    value = struct.unpack(">I", digest[offset : offset + 4])[0] & 0x7FFFFFFF
+    return str(value % _MODULUS).zfill(TOTP_DIGITS)
+
+
+def verify_totp(
+    secret_b32: str, code: str, for_time: float = None, valid_window: int = 0
+) -> bool:
+    """Check a 6-digit SHA-1 TOTP code, equivalent to pyotp.TOTP(secret).verify().
+
+    `valid_window` accepts codes from that many intervals before and after the
+    current one, matching pyotp's argument of the same name.
+    """
+    code = str(code) if code is not None else ""
+    # compare_digest raises TypeError on non-ASCII str, so reject anything
+    # that is not exactly TOTP_DIGITS ASCII digits up front
+    if len(code) != TOTP_DIGITS or not (code.isascii() and code.isdigit()):
+        return False
+    key = _decode_secret(secret_b32)
+    counter = int(time.time() if for_time is None else for_time) // TOTP_INTERVAL
+    for drift in range(-valid_window, valid_window + 1):
+        if hmac.compare_digest(_hotp(key, counter + drift), code):
+            return True
+    return False
+
+
+def provisioning_uri(secret_b32: str, name: str, issuer_name: str = None) -> str:
+    """Build the otpauth:// URI shown as a QR code during 2FA setup.
+
+    Produces the same string as pyotp.TOTP(secret).provisioning_uri() for the
+    default 6-digit, 30-second, SHA-1 parameters.
+    """
+    label = quote(name)
+    params = {"secret": secret_b32}
+    if issuer_name is not None:
+        label = f"{quote(issuer_name)}:{label}"
+        params["issuer"] = issuer_name
+    return f"otpauth://totp/{label}?{urlencode(params).replace('+', '%20')}"
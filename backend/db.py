@@ -1,18 +1,34 @@
-from settings import DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW
+import orjson
+from settings import DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.engine.base import Engine
 from deepsel.utils.query import Query
 from contextlib import contextmanager
 
+
+def _json_serializer(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
 engine: Engine = create_engine(
-    DATABASE_URL, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    # Postgres or a pooler in front of it may drop idle connections; check
+    # before checkout and retire connections before they go stale
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_use_lifo=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 Base = declarative_base()
+SessionLocal = sessionmaker(bind=engine, class_=Session, query_cls=Query)
 
 
 def get_db():
-    db = Session(engine, query_cls=Query)
+    db = SessionLocal()
     try:
         yield db
     finally:
@@ -21,7 +37,7 @@ def get_db():
 
 @contextmanager
 def get_db_context():
-    db = Session(engine, query_cls=Query)
+    db = SessionLocal()
     try:
         yield db
     finally:
@@ -25,23 +25,20 @@ def get_connection():
         conn.close()
 
 
-@contextmanager
-def get_cursor(commit=False):
-    with get_connection() as connection:
-        cursor = connection.cursor()
-        try:
-            yield cursor
-            if commit:
-                connection.commit()
-        finally:
-            cursor.close()
-
-
-def obtain_lock(lock_id: int):
-    with get_cursor(commit=True) as cursor:
+def obtain_lock(connection, lock_id: int):
+    # Session-level advisory locks are released when their connection closes,
+    # so the caller must keep the connection open for the duration of the run
+    with connection.cursor() as cursor:
         cursor.execute("SELECT pg_try_advisory_lock(%s);", (lock_id,))
         (obtained,) = cursor.fetchone()
-        return obtained
+    connection.commit()
+    return obtained
+
+
+def release_lock(connection, lock_id: int):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_unlock(%s);", (lock_id,))
+    connection.commit()
 
 
 async def main():
@@ -56,18 +53,18 @@ async def main():
             )
             .all()
         )
-        for cron in crons:
-            if obtain_lock(cron.id):
-                try:
-                    logger.info(f"Executing cron: {cron.name}")
-                    await cron.execute(db)
-                finally:
-                    with get_cursor(commit=True) as cursor:
-                        cursor.execute("SELECT pg_advisory_unlock(%s);", (cron.id,))
-            else:
-                logger.warning(
-                    f"Could not obtain lock for cron: {cron.name}, another instance maybe running"
-                )
+        with get_connection() as lock_conn:
+            for cron in crons:
+                if obtain_lock(lock_conn, cron.id):
+                    try:
+                        logger.info(f"Executing cron: {cron.name}")
+                        await cron.execute(db)
+                    finally:
+                        release_lock(lock_conn, cron.id)
+                else:
+                    logger.warning(
+                        f"Could not obtain lock for cron: {cron.name}, another instance maybe running"
+                    )
 
 
 if __name__ == "__main__":
@@ -66,7 +66,7 @@ async def lifespan(application: FastAPI):
             install_seed_data(app_folders, db)
         # Check app versions and run app upgrade tasks
         with get_db_context() as db:
-            org = db.query(OrganizationModel).get(DEFAULT_ORG_ID)
+            org = db.get(OrganizationModel, DEFAULT_ORG_ID)
             on_startup(
                 db=db,
                 app_names=installed_apps,
@@ -28,6 +28,7 @@ DATABASE_URL = f"postgresql://{quote_plus(DB_USER)}:{quote_plus(DB_PASSWORD)}@{q
 # Database optionals
 DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
 DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # unit: seconds
 
 # General settings
 FILESYSTEM = os.getenv("FILESYSTEM", "local")